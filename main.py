@@ -1,32 +1,46 @@
 #!/usr/bin/env python3
+import logging
 import math
+import re
+import selectors
 import threading
 import time
 import subprocess
 import serial
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
 from time import time as now
-from queue import Queue
 
 from kivy.app import App
 from kivy.lang import Builder
 from kivy.clock import Clock
 from kivy.properties import (
-    ListProperty, NumericProperty, StringProperty, DictProperty, BooleanProperty
+    ListProperty, NumericProperty, StringProperty, BooleanProperty
 )
 from kivy.uix.widget import Widget
 from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
 from kivy.graphics import Color, Ellipse
 
 # -----------------------
 # Config
 # -----------------------
-HOLES = [
-    {"id": 1, "pos_hint": (0.0913, 0.6378), "radius": 8, "last_points": None},
-    {"id": 2, "pos_hint": (0.3620, 0.7678), "radius": 8, "last_points": None},
-    {"id": 3, "pos_hint": (0.1985, 0.2817), "radius": 8, "last_points": None},
-    {"id": 4, "pos_hint": (0.7452, 0.2276), "radius": 8, "last_points": None},
-    {"id": 5, "pos_hint": (0.9331, 0.3715), "radius": 8, "last_points": None},
-]
+@dataclass(frozen=True, slots=True)
+class Hole:
+    id: int
+    pos_hint: tuple  # (x, y) as fractions of the green's size
+    radius: int
+
+
+# Static hole layout; per-game state such as readings lives on GolfGreen
+HOLES = (
+    Hole(1, (0.0913, 0.6378), 8),
+    Hole(2, (0.3620, 0.7678), 8),
+    Hole(3, (0.1985, 0.2817), 8),
+    Hole(4, (0.7452, 0.2276), 8),
+    Hole(5, (0.9331, 0.3715), 8),
+)
 
 MIN_READING = 0
 MAX_READING = 10  # base max points for distance calculation
@@ -42,90 +56,229 @@ HOLE_NAME_PREFIXES = {
     5: "HOLE_5",
 }
 
+# "Device <addr> <name>" lines from `bluetoothctl devices`, one pattern per hole
+HOLE_DEVICE_PATTERNS = {
+    prefix: re.compile(rf"^Device ([0-9A-Fa-f:]{{17}}) {re.escape(prefix)}", re.MULTILINE)
+    for prefix in HOLE_NAME_PREFIXES.values()
+}
+
 BT_RETRY_DELAY = 5  # seconds
-bt_event_queue = Queue()
+log = logging.getLogger("golf")
+bt_selector = selectors.DefaultSelector()
+bt_bind_lock = threading.Lock()  # bluetoothctl/rfcomm and selector registration, one hole at a time
 
 
 # -----------------------
-# Utility: run shell cmd
+# Utility: run a command
 # -----------------------
-def run_cmd(cmd):
+def run_cmd(args):
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(args, capture_output=True, text=True)
         return result.stdout.strip()
     except Exception as e:
-        print("⚠️", e)
+        log.warning("⚠️ %s", e)
         return ""
 
 
 # -----------------------
-# Bluetooth Thread
+# Scoring
 # -----------------------
-def bt_auto_thread(hole_id, name_prefix):
+def distance_to_reading(dist, scale):
+    """Map a ball-to-hole distance to a reading between 0 and MAX_READING.
+
+    ``scale`` is ``MAX_READING / max_dist``, cached on resize as
+    ``GolfGreen._reading_scale``.
+    """
+    r = dist * scale
+    return MAX_READING if r >= MAX_READING else int(r)
+
+
+# -----------------------
+# Message parsing
+# -----------------------
+def parse_hole_message(line):
+    """Return the hole id for a ``b"HOLE:<id>:1"`` hit line, else None."""
+    parts = line.split(b":", 2)
+    if len(parts) < 3 or parts[0] != b"HOLE" or not parts[2].startswith(b"1"):
+        return None
+    try:
+        return int(parts[1])
+    except ValueError:
+        return None
+
+
+# -----------------------
+# Bluetooth Threads
+# -----------------------
+def scan_devices():
+    """Run one discovery window and return the ``bluetoothctl devices`` listing."""
+    scan = subprocess.Popen(["bluetoothctl", "scan", "on"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        time.sleep(6)
+        devices = run_cmd(["bluetoothctl", "devices"])
+        run_cmd(["bluetoothctl", "scan", "off"])
+    finally:
+        scan.terminate()
+        scan.wait()
+    return devices
+
+
+def find_device_addr(devices, name_prefix):
+    m = HOLE_DEVICE_PATTERNS[name_prefix].search(devices)
+    return m.group(1) if m else None
+
+
+def connect_hole(hole_id, name_prefix, addr):
+    """Bind a hole's module to /dev/rfcomm<id> and register it with the reader.
+
+    Returns an Event the reader sets when the port drops, or None on failure.
+    """
     port = f"/dev/rfcomm{hole_id}"
-    while True:
+    with bt_bind_lock:
+        run_cmd(["bluetoothctl", "pair", addr])
+        run_cmd(["bluetoothctl", "trust", addr])
+        run_cmd(["bluetoothctl", "connect", addr])
+        run_cmd(["sudo", "rfcomm", "release", str(hole_id)])
+        run_cmd(["sudo", "rfcomm", "bind", str(hole_id), addr, "1"])
+    log.info("[BT] 🔗 Bound %s -> %s", addr, port)
+
+    # Waiting for the port is the slow part; other holes may bind meanwhile
+    ser = None
+    for _ in range(3):
         try:
-            print(f"[BT] 🔍 Scanning for {name_prefix}...")
-            run_cmd("bluetoothctl scan on &")
-            time.sleep(6)
-            devices = run_cmd("bluetoothctl devices")
-            run_cmd("bluetoothctl scan off")
-
-            addr = None
-            for line in devices.splitlines():
-                if name_prefix in line:
-                    addr = line.split()[1]
-                    break
+            ser = serial.Serial(port, 9600, timeout=1)
+            log.info("[BT] 💬 Listening on %s", port)
+            break
+        except Exception:
+            time.sleep(1)
 
-            if not addr:
-                print(f"[BT] ❌ {name_prefix} not found, retrying in {BT_RETRY_DELAY}s")
-                time.sleep(BT_RETRY_DELAY)
-                continue
+    if not ser:
+        log.warning("[BT] ⚠️ Cannot open %s, retrying...", port)
+        with bt_bind_lock:
+            run_cmd(["sudo", "rfcomm", "release", str(hole_id)])
+        return None
 
-            print(f"[BT] ✅ Found {name_prefix} at {addr}")
-            run_cmd(f"bluetoothctl pair {addr}")
-            run_cmd(f"bluetoothctl trust {addr}")
-            run_cmd(f"bluetoothctl connect {addr}")
-            run_cmd(f"sudo rfcomm release {hole_id} || true")
-            run_cmd(f"sudo rfcomm bind {hole_id} {addr} 1")
-            print(f"[BT] 🔗 Bound {addr} -> {port}")
-
-            ser = None
-            for _ in range(3):
-                try:
-                    ser = serial.Serial(port, 9600, timeout=1)
-                    print(f"[BT] 💬 Listening on {port}")
-                    break
-                except Exception:
-                    time.sleep(1)
+    # Hand the port to the shared reader; it signals when the link drops
+    lost = threading.Event()
+    with bt_bind_lock:
+        try:
+            bt_selector.register(ser, selectors.EVENT_READ, data=(name_prefix, ser, lost))
+        except Exception:
+            ser.close()
+            raise
+    return lost
+
+
+def bind_holes(targets):
+    """Connect {hole_id: (name_prefix, addr)} with one worker per hole.
+
+    Returns {hole_id: lost Event or None}. A slow port open on one module
+    never holds up the rest; connect_hole serializes the shared steps.
+    """
+    results = {}
+    results_lock = threading.Lock()
+
+    def worker(hole_id, name_prefix, addr):
+        try:
+            lost = connect_hole(hole_id, name_prefix, addr)
+        except Exception as e:
+            log.warning("[BT] Connect failed (%s): %s", name_prefix, e)
+            lost = None
+        with results_lock:
+            results[hole_id] = lost
+
+    workers = [threading.Thread(target=worker, args=(hole_id, name_prefix, addr), daemon=True)
+               for hole_id, (name_prefix, addr) in targets.items()]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return results
+
+
+def bt_supervisor_thread():
+    """Scan once for all unconnected holes per cycle and (re)bind them."""
+    connected = {}  # hole_id -> Event set by the reader on disconnect
+    known_addrs = {}  # name_prefix -> last address found by a scan
+    while True:
+        for hole_id, lost in list(connected.items()):
+            if lost.is_set():
+                log.info("[BT] 🔌 %s disconnected, reconnecting...", HOLE_NAME_PREFIXES[hole_id])
+                run_cmd(["sudo", "rfcomm", "release", str(hole_id)])
+                del connected[hole_id]
+
+        missing = {hid: prefix for hid, prefix in HOLE_NAME_PREFIXES.items()
+                   if hid not in connected}
+
+        # Reconnect to known modules first; only rescan for ones that fail
+        known = {hid: (prefix, known_addrs[prefix]) for hid, prefix in missing.items()
+                 if prefix in known_addrs}
+        for hole_id, lost in bind_holes(known).items():
+            if lost is not None:
+                connected[hole_id] = lost
+                del missing[hole_id]
+            else:
+                del known_addrs[known[hole_id][0]]
+
+        if missing:
+            try:
+                log.info("[BT] 🔍 Scanning for %s...", ", ".join(missing.values()))
+                devices = scan_devices()
+            except Exception:
+                log.exception("[BT] Exception in supervisor")
+                devices = ""
+
+            found = {}
+            for hole_id, name_prefix in missing.items():
+                addr = find_device_addr(devices, name_prefix)
+                if not addr:
+                    log.info("[BT] ❌ %s not found, retrying in %ss", name_prefix, BT_RETRY_DELAY)
+                    continue
+                log.info("[BT] ✅ Found %s at %s", name_prefix, addr)
+                known_addrs[name_prefix] = addr
+                found[hole_id] = (name_prefix, addr)
+            for hole_id, lost in bind_holes(found).items():
+                if lost is not None:
+                    connected[hole_id] = lost
+
+        time.sleep(BT_RETRY_DELAY)
 
-            if not ser:
-                print(f"[BT] ⚠️ Cannot open {port}, retrying...")
-                time.sleep(BT_RETRY_DELAY)
+
+def bt_reader_thread(golf_widget):
+    """Read every bound hole port from one thread via a shared selector."""
+    buffers = {}
+    while True:
+        hits = []
+        for key, _ in bt_selector.select(timeout=1.0):
+            name_prefix, ser, lost = key.data
+            try:
+                data = ser.read(ser.in_waiting or 1)
+            except (serial.SerialException, OSError) as e:
+                log.warning("[BT] Read failed (%s): %s", name_prefix, e)
+                bt_selector.unregister(ser)
+                ser.close()
+                buffers.pop(name_prefix, None)
+                lost.set()
                 continue
 
+            buf = buffers.setdefault(name_prefix, bytearray())
+            buf.extend(data)
             while True:
-                data = ser.readline()
-                if not data:
-                    continue
-                msg = data.decode(errors="ignore").strip()
-                if msg:
-                    print(f"[BT][{name_prefix}] {msg}")
-                    # When a hit is detected, queue it for processing
-                    parts = msg.split(":")
-                    if len(parts) >= 3 and parts[0] == "HOLE":
-                        try:
-                            hid = int(parts[1])
-                            if parts[2].startswith("1"):
-                                bt_event_queue.put(hid)
-                        except ValueError:
-                            pass
+                nl = buf.find(b"\n")
+                if nl < 0:
+                    break
+                line = buf[:nl].strip()
+                del buf[:nl + 1]
+                if line:
+                    log.debug("[BT][%s] %r", name_prefix, line)
+                    hid = parse_hole_message(line)
+                    if hid is not None:
+                        hits.append(hid)
 
-        except Exception as e:
-            print(f"[BT] Exception ({name_prefix}):", e)
-        finally:
-            run_cmd(f"sudo rfcomm release {hole_id} || true")
-            time.sleep(BT_RETRY_DELAY)
+        # Clock is thread-safe: hand this wakeup's hits to the Kivy thread at once
+        if hits:
+            Clock.schedule_once(partial(dispatch_hole_hits, golf_widget, hits))
 
 
 # -----------------------
@@ -136,10 +289,8 @@ class GolfGreen(Widget):
     current_player_index = NumericProperty(0)
     current_round = NumericProperty(1)
     current_player = StringProperty("")
-    player_scores = DictProperty({})
     ball_x = NumericProperty(-1000)
     ball_y = NumericProperty(-1000)
-    holes = ListProperty(HOLES.copy())
     ball_placed = BooleanProperty(False)
     mode = StringProperty("Normal")
     mode_selected = BooleanProperty(True)
@@ -147,6 +298,9 @@ class GolfGreen(Widget):
     ball_radius = NumericProperty(6)
     last_hole_time = NumericProperty(0)
     hole_cooldown = 1.0
+    place_cooldown = 0.5
+    MARK_COLOR = (1, 1, 1, 1)  # holes and ball
+
     def hole_scored(self, hole_number):
         if not self.game_started:
             return
@@ -160,7 +314,7 @@ class GolfGreen(Widget):
         # Add to that player’s score
         self.players[player] += hole_points
 
-        print(f"{player} scored {hole_points} on hole {hole_number}")
+        log.info("%s scored %s on hole %s", player, hole_points, hole_number)
 
     
     def update_scores_display(self):
@@ -171,76 +325,141 @@ class GolfGreen(Widget):
                     [f"{p}: {self.get_player_score(p)}" for p in self.players]
                 )
             except Exception as e:
-                print("Error updating scores:", e)
+                log.warning("Error updating scores: %s", e)
 
 
     def __init__(self, **kwargs):
+        self._scaled_positions = []  # (hole_id, hx, hy, radius) per hole
+        self._batching = False
+        self._last_place_time = 0.0
+        self._side_panel = None  # resolved once in on_kv_post
+        # Internal state no kv rule observes stays out of Kivy properties
+        self.player_scores = {}
+        self._score_totals = {}
+        self._reading_scale = float(MAX_READING)  # MAX_READING / green diagonal
+        self.holes = HOLES
+        self.last_points = [None] * len(self.holes)  # live reading per hole
+        self._hole_index = {h.id: i for i, h in enumerate(self.holes)}
         super().__init__(**kwargs)
-        self.bind(size=self.update_canvas, pos=self.update_canvas)
-        Clock.schedule_once(lambda dt: self.update_canvas(), 0)
+        # Hole and ball instructions are created once and mutated in place;
+        # they all share one Color, and the ball is only in the canvas when placed.
+        # canvas.before keeps them under the hole labels, which are our children
+        self._hole_ellipses = [Ellipse() for _ in self.holes]
+        self._ball_ellipse = Ellipse(size=(self.ball_radius * 2,) * 2)
+        self._ball_shown = False
+        self.canvas.before.add(Color(*self.MARK_COLOR))
+        for el in self._hole_ellipses:
+            self.canvas.before.add(el)
+        # One label per hole, as our own children so they follow the green
+        self._hole_labels = []
+        for hole in self.holes:
+            lbl = Label(text=f"H{hole.id}: -", size_hint=(None, None), size=(100, 24),
+                        font_size=16)
+            self.add_widget(lbl)
+            self._hole_labels.append((lbl, f"H{hole.id}: "))
+        # size and pos often change together in one layout pass; redraw once
+        self._trigger_recompute = Clock.create_trigger(self._recompute_positions)
+        self.bind(size=self._trigger_recompute, pos=self._trigger_recompute)
+        self.bind(ball_x=self._on_ball_move, ball_y=self._on_ball_move,
+                  ball_placed=self._update_ball, ball_radius=self._on_ball_radius)
+        self._trigger_recompute()
+
+    def on_kv_post(self, base_widget):
+        self._side_panel = base_widget.ids.get("side_panel")
+        # Built outside a kv rule, this runs from Widget.__init__ before the
+        # instructions above exist; the trigger from __init__ draws instead
+        if hasattr(self, "_trigger_recompute"):
+            self._recompute_positions()
+
+    def _recompute_positions(self, *args):
+        """Cache hole pixel positions; they only change with size/pos."""
+        x, y = self.x, self.y
+        w, h = max(1, self.width), max(1, self.height)
+        self._reading_scale = MAX_READING / math.hypot(w, h)
+        self._scaled_positions = [
+            (hole.id, x + hole.pos_hint[0] * w, y + hole.pos_hint[1] * h, hole.radius)
+            for hole in self.holes
+        ]
+        for el, (_, hx, hy, r) in zip(self._hole_ellipses, self._scaled_positions):
+            el.pos = (hx - r, hy - r)
+            el.size = (r * 2, r * 2)
+        self.update_canvas()
 
-    def update_canvas(self, *args):
-        self.canvas.after.clear()
-        with self.canvas.after:
-            for hole in self.holes:
-                hx, hy = self.get_scaled_hole_pos(hole)
-                Color(1, 1, 1, 1)
-                Ellipse(pos=(hx - hole["radius"], hy - hole["radius"]),
-                        size=(hole["radius"] * 2, hole["radius"] * 2))
+    @contextmanager
+    def _batch(self):
+        """Defer redraws while several properties change, then refresh once."""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self.update_canvas()
+
+    def _on_ball_radius(self, instance, r):
+        # The ball's size only changes with its radius, not on every move
+        self._ball_ellipse.size = (r * 2, r * 2)
+        self._update_ball()
+
+    def _on_ball_move(self, *args):
+        # A hidden ball (e.g. reset to -1000) needs no redraw
+        if self.ball_placed:
+            self._update_ball()
+
+    def _update_ball(self, *args):
+        if self._batching:
+            return
+        if self.ball_placed != self._ball_shown:
             if self.ball_placed:
-                Color(1, 1, 1, 1)
-                Ellipse(pos=(self.x + self.ball_x - self.ball_radius,
-                             self.y + self.ball_y - self.ball_radius),
-                        size=(self.ball_radius*2, self.ball_radius*2))
+                self.canvas.before.add(self._ball_ellipse)
+            else:
+                self.canvas.before.remove(self._ball_ellipse)
+            self._ball_shown = self.ball_placed
+        r = self.ball_radius
+        self._ball_ellipse.pos = (self.x + self.ball_x - r, self.y + self.ball_y - r)
 
-        # Update hole labels
-        try:
-            root = App.get_running_app().root
-            if root and hasattr(root, 'ids'):
-                for i, hole in enumerate(self.holes, start=1):
-                    hid = f"h{i}"
-                    lbl = root.ids.get(hid)
-                    if lbl:
-                        hx, hy = self.get_scaled_hole_pos(hole)
-                        lbl.pos = (hx - lbl.width / 2, hy + 12)
-                        lp = hole.get("last_points")
-                        lbl.text = f"H{i}: {lp if lp is not None else '-'}"
-        except Exception:
-            pass
+    def update_canvas(self, *args):
+        self._update_ball()
 
-    def get_scaled_hole_pos(self, hole):
-        phx, phy = hole.get("pos_hint", (0.5, 0.5))
-        px = self.x + phx * max(1, self.width)
-        py = self.y + phy * max(1, self.height)
-        return px, py
+        # Update hole labels
+        for (lbl, prefix), lp, (_, hx, hy, _) in zip(
+                self._hole_labels, self.last_points, self._scaled_positions):
+            # Only touch changed values; text changes re-render the texture
+            pos = (hx - lbl.width / 2, hy + 12)
+            if tuple(lbl.pos) != pos:
+                lbl.pos = pos
+            text = prefix + (str(lp) if lp is not None else "-")
+            if lbl.text != text:
+                lbl.text = text
 
     def register_players(self, count=2):
         self.players = [f"Player {i+1}" for i in range(count)]
         self.player_scores = {p: [] for p in self.players}
+        self._score_totals = {}
         self.current_player_index = 0
         self.current_round = 1
         self.current_player = self.players[0]
         self.ball_placed = False
         self.game_started = False
-        for h in HOLES:
-            h["last_points"] = None
-        self.holes = HOLES.copy()
+        self.last_points = [None] * len(self.holes)
         self.update_canvas()
-        print("Players registered:", self.players)
+        log.info("Players registered: %s", self.players)
+
+    def _reset_scores(self):
+        # The player set is unchanged here, so empty the lists in place
+        for scores in self.player_scores.values():
+            scores.clear()
+        self._score_totals.clear()
 
     def get_player_score(self, player):
-        scores = self.player_scores.get(player, [])
-        return sum(scores) if scores else 0
+        return self._score_totals.get(player, 0)
 
     def start_game(self):
         if not self.players:
             return
 
         # Reset all player scores and hole data
-        self.player_scores = {p: [] for p in self.players}
-        for h in HOLES:
-            h["last_points"] = None
-        self.holes = HOLES.copy()
+        self._reset_scores()
+        self.last_points = [None] * len(self.holes)
 
         # Reset ball + round
         self.game_started = True
@@ -252,19 +471,18 @@ class GolfGreen(Widget):
         self.ball_y = -1000
         self.update_scores_display()
         self.update_canvas()
-        print("🟢 Game started. Scores reset. Current player:", self.current_player)
+        log.info("🟢 Game started. Scores reset. Current player: %s", self.current_player)
 
 
     def replace_ball(self):
         if not self.game_started or self.current_player_index != 0:
             return
-        self.ball_placed = False
-        self.ball_x = -1000
-        self.ball_y = -1000
-        for h in self.holes:
-            h["last_points"] = None
-        self.update_canvas()
-        print("Ball replaced for re-placement by first player")
+        with self._batch():
+            self.ball_placed = False
+            self.ball_x = -1000
+            self.ball_y = -1000
+            self.last_points = [None] * len(self.holes)
+        log.debug("Ball replaced for re-placement by first player")
 
     def next_player(self):
         if not self.players:
@@ -274,122 +492,116 @@ class GolfGreen(Widget):
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
         self.current_player = self.players[self.current_player_index]
 
-        print(f"➡️ Next player: {self.current_player}")
+        log.debug("➡️ Next player: %s", self.current_player)
 
 
 
     def clear_scores(self):
-        self.player_scores = {p: [] for p in self.players}
-        self.update_canvas()
+        with self._batch():
+            self._reset_scores()
 
     def on_touch_down(self, touch):
         if not (self.mode_selected and self.mode == "Normal" and self.game_started):
             return False
-        root = App.get_running_app().root
-        side = root.ids.get("side_panel", None)
-        if side and side.collide_point(*touch.pos):
+        # GolfGreen has no transform, so bounds and local coords come straight from x/y
+        tx, ty = touch.pos
+        x, y = self.x, self.y
+        if not (x <= tx <= x + self.width and y <= ty <= y + self.height):
             return False
-        if not self.collide_point(*touch.pos):
+        side = self._side_panel
+        if side and side.collide_point(tx, ty):
             return False
         if self.ball_placed:
-            print("Ball already placed for this round; ignore touch")
+            log.debug("Ball already placed for this round; ignore touch")
+            return True
+        current_time = Clock.get_time()
+        if current_time - self._last_place_time < self.place_cooldown:
             return True
-        self._touch_x = touch.x - self.x
-        self._touch_y = touch.y - self.y
-        Clock.schedule_once(self._place_ball, 0.05)
+        self._last_place_time = current_time
+        self._place_ball(tx - x, ty - y)
         return True
 
-    def _place_ball(self, dt):
+    def _place_ball(self, local_x, local_y):
         if self.ball_placed:
             return
-        local_x = getattr(self, "_touch_x", None)
-        local_y = getattr(self, "_touch_y", None)
-        if local_x is None or local_y is None:
-            return
 
-        max_diag = math.hypot(max(1, self.width), max(1, self.height))
-        nearest_hole = None
+        scale = self._reading_scale
+        last_points = []
+        nearest_id = None
         best_points = None
 
-        for hole in self.holes:
-            hx, hy = self.get_scaled_hole_pos(hole)
-            dist = math.hypot(hx - self.x - local_x, hy - self.y - local_y)
+        # Hoist lookups out of the per-hole loop
+        hypot = math.hypot
+        bx = self.x + local_x
+        by = self.y + local_y
+        for hid, hx, hy, _ in self._scaled_positions:
+            dist = hypot(hx - bx, hy - by)
 
             # Calculate points only — do NOT add yet
-            pts = min(MAX_READING, int((dist / max_diag) * MAX_READING))
-            hole["last_points"] = pts
+            pts = distance_to_reading(dist, scale)
+            last_points.append(pts)
 
             if best_points is None or pts > best_points:
                 best_points = pts
-                nearest_hole = hole
+                nearest_id = hid
 
         # Just place the ball visually
-        self.ball_x = local_x
-        self.ball_y = local_y
-        self.ball_placed = True
-        self.update_canvas()
-        print(f"⚪ Ball placed by {self.current_player} (potential {best_points} pts for hole {nearest_hole['id']})")
+        with self._batch():
+            self.last_points = last_points
+            self.ball_x = local_x
+            self.ball_y = local_y
+            self.ball_placed = True
+        log.debug("⚪ Ball placed by %s (potential %s pts for hole %s)",
+                  self.current_player, best_points, nearest_id)
 
 
     def award_hole_points(self, hole_id):
         current_time = now()
         if current_time - self.last_hole_time < self.hole_cooldown:
-            print(f"⏳ Ignored duplicate trigger for hole {hole_id}")
+            log.debug("⏳ Ignored duplicate trigger for hole %s", hole_id)
             return
         self.last_hole_time = current_time
 
-        hole = next((h for h in self.holes if h["id"] == hole_id), None)
-        if not hole:
-            print(f"⚠️ Hole {hole_id} not found")
+        idx = self._hole_index.get(hole_id)
+        if idx is None:
+            log.warning("⚠️ Hole %s not found", hole_id)
             return
 
-        pts = hole.get("last_points")
+        pts = self.last_points[idx]
         if pts is None:
             pts = int(MAX_READING / 2)
 
         player = self.current_player
         if not player:
-            print("⚠️ No active player to award points to")
+            log.warning("⚠️ No active player to award points to")
             return
 
         # Award points only once
         self.player_scores.setdefault(player, []).append(pts)
-        print(f"🏁 Hole {hole_id} → {player} scored {pts} points!")
+        self._score_totals[player] = self._score_totals.get(player, 0) + pts
+        log.info("🏁 Hole %s → %s scored %s points!", hole_id, player, pts)
 
         self.update_scores_display()
 
         # Reset for next player
-        self.ball_placed = False
-        self.ball_x = -1000
-        self.ball_y = -1000
-
-        self.next_player()
-        self.update_canvas()
+        with self._batch():
+            self.ball_placed = False
+            self.ball_x = -1000
+            self.ball_y = -1000
+            self.next_player()
 
 
 
 
-def process_bt_queue(dt):
-    app = App.get_running_app()
-    if not app or not hasattr(app.root, 'ids'):
-        return
-
-    golf_widget = app.root.ids.get("golf", None)
-    if not golf_widget or not isinstance(golf_widget, GolfGreen):
-        return
-
-    # Only process each Bluetooth event once
-    while not bt_event_queue.empty():
-        hid = bt_event_queue.get_nowait()
-        print(f"[BT EVENT] Hole {hid} triggered")
+def dispatch_hole_hits(golf_widget, hids, dt):
+    for hid in hids:
+        log.debug("[BT EVENT] Hole %s triggered", hid)
         golf_widget.award_hole_points(hid)
 
 
-
-
-def start_bt_threads():
-    for hid, prefix in HOLE_NAME_PREFIXES.items():
-        threading.Thread(target=bt_auto_thread, args=(hid, prefix), daemon=True).start()
+def start_bt_threads(golf_widget):
+    threading.Thread(target=bt_reader_thread, args=(golf_widget,), daemon=True).start()
+    threading.Thread(target=bt_supervisor_thread, daemon=True).start()
 
 
 # -----------------------
@@ -401,10 +613,12 @@ class RootWidget(BoxLayout):
 
 class MiniGolfApp(App):
     def build(self):
-        Clock.schedule_interval(process_bt_queue, 0.1)
-        start_bt_threads()
         return RootWidget()
 
+    def on_start(self):
+        self.green = self.root.ids.golf
+        start_bt_threads(self.green)
+
 
 if __name__ == "__main__":
     MiniGolfApp().run()
\ No newline at end of file
@@ -3,21 +3,29 @@ from kivy.uix.widget import Widget
 from kivy.properties import ListProperty
 import time
 
+MAX_SCORES = 10
+
 class Scoreboard(Widget):
     scores = ListProperty([])  # list of dicts: {"hole": id, "points": pts, "time": ts}
+    _scores_text = None  # cached _format_scores() result, dropped on change
+
+    def on_scores(self, instance, value):
+        self._scores_text = None
 
     def add_score(self, hole, points):
-        self.scores.insert(0, {"hole": hole, "points": points, "time": int(time.time())})
-        # keep it short
-        self.scores = self.scores[:10]
+        entry = {"hole": hole, "points": points, "time": int(time.time())}
+        # one assignment, so observers see a single change per score
+        self.scores = [entry] + self.scores[:MAX_SCORES - 1]
 
     def clear(self):
         self.scores = []
 
     def _format_scores(self):
+        if self._scores_text is not None:
+            return self._scores_text
         if not self.scores:
-            return "No scores yet"
-        lines = []
-        for s in self.scores:
-            lines.append(f"H{s.get('hole')}  +{s.get('points')}")
-        return "\n".join(lines)
\ No newline at end of file
+            text = "No scores yet"
+        else:
+            text = "\n".join(f"H{s.get('hole')}  +{s.get('points')}" for s in self.scores)
+        self._scores_text = text
+        return text
\ No newline at end of file